@@ -1,12 +1,117 @@
 import logging
 import json
+import os
+import re
+import threading
+import time
 from datetime import datetime
+from pathlib import Path
 from typing import Optional, Callable
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from utils import jsonio
+from utils.fileio import atomic_open
 
 logger = logging.getLogger("OllamaChat")
 
+# /api/chat payloads are flat apart from "message"; pulling the two fields we
+# use straight from the raw bytes avoids building a dict for every streamed
+# token, and skips decoding the large "context" arrays of full replies.
+_CONTENT_RE = re.compile(rb'"content":"((?:[^"\\]|\\.)*)"')
+_DONE_RE = re.compile(rb'"done":true')
+
+_TRANSCRIPT_SEP = "-" * 80 + "\n\n"
+
+CHAT_LOG_SUFFIX = ".jsonl"
+
+
+def _encode_turns(users: list[str], assistants: list[str]) -> list[bytes]:
+    return [
+        jsonio.dumps({"type": "turn", "user": user, "assistant": assistant}) + b"\n"
+        for user, assistant in zip(users, assistants)
+    ]
+
+
+def _encode_chat_log(data: dict) -> list[bytes]:
+    """Encode saved-chat data as JSONL: a metadata record, then one record per turn."""
+    meta = {key: value for key, value in data.items() if key != "turns"}
+    lines = [jsonio.dumps({"type": "session_metadata", **meta}) + b"\n"]
+    lines.extend(_encode_turns(data["turns"]["user"], data["turns"]["assistant"]))
+    return lines
+
+
+def _parse_chat_file(raw: bytes) -> tuple[dict, bool]:
+    """Parse a saved chat in JSONL or legacy JSON form.
+
+    Returns the chat data and whether the file was a JSONL log.
+    """
+    first, _, rest = raw.partition(b"\n")
+    try:
+        head = jsonio.loads(first)
+    except ValueError:
+        head = None
+    if not (isinstance(head, dict) and head.get("type") == "session_metadata"):
+        return jsonio.loads(raw), False
+
+    users, assistants = [], []
+    for line in rest.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = jsonio.loads(line)
+        except ValueError:
+            # A partially written last line from an interrupted append.
+            logger.warning("Skipping malformed line in chat log")
+            continue
+        if record.get("type") == "turn":
+            users.append(record["user"])
+            assistants.append(record["assistant"])
+        elif record.get("type") == "session_metadata":
+            # Settings changed after the log was started.
+            head.update(record)
+    data = {key: value for key, value in head.items() if key != "type"}
+    data["turns"] = {"user": users, "assistant": assistants}
+    return data, True
+
+
+def _append_log_lines(path: str, lines: list[bytes]) -> None:
+    """Append records to a JSONL chat log, starting on a fresh line."""
+    with open(path, "a+b") as file:
+        # An interrupted append can leave a torn last line without its
+        # newline; new records written straight after it would be merged
+        # into that malformed line and skipped on every later load.
+        if file.seek(0, os.SEEK_END):
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b"\n":
+                file.write(b"\n")
+        file.writelines(lines)
+
+
+def _log_metadata(data: dict) -> dict:
+    """The metadata fields whose change needs a new session_metadata record."""
+    return {key: value for key, value in data.items() if key not in ("turns", "timestamp")}
+
+
+def _transcript_turns(users: list[str], assistants: list[str], start: int = 1) -> str:
+    """Render turns as transcript text, built in one join so it can be written at once."""
+    return "".join(
+        f"[{i}] User: {user}\n\n[{i}] Assistant: {assistant}\n\n{_TRANSCRIPT_SEP}"
+        for i, (user, assistant) in enumerate(zip(users, assistants), start)
+    )
+
+
+def _extract_content(line: bytes) -> tuple[str, bool]:
+    """Return the message content and done flag of one /api/chat payload."""
+    match = _CONTENT_RE.search(line)
+    if match is None:
+        chunk = json.loads(line)
+        return chunk.get("message", {}).get("content", ""), chunk.get("done", False)
+    raw = match.group(1)
+    text = json.loads(b'"' + raw + b'"') if b"\\" in raw else raw.decode("utf-8")
+    return text, _DONE_RE.search(line) is not None
+
 
 class OllamaClient:
     """Backend client for communicating with Ollama API."""
@@ -18,14 +123,84 @@ class OllamaClient:
         "num_ctx": 2048,
     }
 
+    CONNECTION_TTL = 5.0
+    # (connect, read) timeouts for the small metadata endpoints.
+    METADATA_TIMEOUT = (3, 10)
+
     def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3.2"):
         self.base_url = base_url
         self.model = model
         self.parameters = self.DEFAULT_PARAMS.copy()
         self.system_prompt: str = ""
-        self.conversation: list[dict[str, str]] = []
+        # Turns are stored as parallel lists rather than one dict per exchange.
+        self.users: list[str] = []
+        self.assistants: list[str] = []
         self.chat_name: str = ""
         self.save_dir = "chat_history"
+        self._save_lock = threading.Lock()
+        # Directories already created or confirmed by an earlier save.
+        self._ensured_dirs: set[str] = set()
+        # Append-only JSONL log of the current chat and how many turns it holds.
+        self.log_path: Optional[str] = None
+        self._logged_turns = 0
+        self._logged_meta: Optional[dict] = None
+        # Bumped whenever the conversation is replaced or cleared; a reply
+        # started under an older id belongs to a chat that is gone.
+        self._session_id = 0
+        # (monotonic time, base_url, reachable) of the last request to the server.
+        self._conn_state: Optional[tuple[float, str, bool]] = None
+        self._models_cache: list[str] = []
+        self._models_etag: Optional[str] = None
+        self._models_url: Optional[str] = None
+
+        # One pooled session for every API call so keep-alive connections are
+        # reused instead of paying a new TCP handshake per request.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": "SimpleOllamaGUI/1.0",
+        })
+
+    @property
+    def conversation(self) -> list[dict[str, str]]:
+        """The conversation as a list of {"user", "assistant"} exchanges."""
+        return [{"user": u, "assistant": a} for u, a in zip(self.users, self.assistants)]
+
+    def _record_turn(self, user: str, assistant: str, session_id: int) -> None:
+        with self._save_lock:
+            if session_id != self._session_id:
+                # The chat was cleared or another one opened while this reply
+                # was in flight; don't write it into the new chat or its log.
+                logger.info("Dropping reply for a conversation that was replaced")
+                return
+            self.users.append(user)
+            self.assistants.append(assistant)
+            if self.log_path:
+                try:
+                    self._append_logged_turns_locked()
+                except OSError as e:
+                    logger.error(f"Error appending to chat log: {e}")
+
+    def _append_logged_turns_locked(self) -> None:
+        """Append turns not yet in the JSONL log and text transcript instead of rewriting them."""
+        if not self.log_path:
+            return
+        start, end = self._logged_turns, len(self.assistants)
+        if end <= start:
+            return
+        users, assistants = self.users[start:end], self.assistants[start:end]
+        _append_log_lines(self.log_path, _encode_turns(users, assistants))
+        with open(Path(self.log_path).with_suffix(".txt"), "a", encoding="utf-8") as file:
+            file.write(_transcript_turns(users, assistants, start + 1))
+        self._logged_turns = end
+
+    def close(self) -> None:
+        """Release pooled connections held by the HTTP session."""
+        self.session.close()
 
     @property
     def api_chat(self) -> str:
@@ -44,7 +219,20 @@ class OllamaClient:
         prompt: str,
         stream_callback: Optional[Callable[[str], None]] = None,
     ) -> str:
-        """Send a message to the Ollama API and get a response."""
+        """Send a message to the Ollama API and get a response.
+
+        On failure the error message is returned in place of the reply; use
+        ``chat_result`` to tell the two apart.
+        """
+        reply, error = self.chat_result(prompt, stream_callback)
+        return error if error is not None else reply
+
+    def chat_result(
+        self,
+        prompt: str,
+        stream_callback: Optional[Callable[[str], None]] = None,
+    ) -> tuple[str, Optional[str]]:
+        """Like ``chat``, but return ``(reply, error)`` with error None on success."""
         messages = [{"role": "user", "content": prompt}]
         if self.system_prompt:
             messages.insert(0, {"role": "system", "content": self.system_prompt})
@@ -57,145 +245,310 @@ class OllamaClient:
         }
         data = {k: v for k, v in data.items() if v is not None}
 
+        session_id = self._session_id
         try:
             if stream_callback:
-                return self._chat_stream(data, stream_callback)
+                return self._chat_stream(data, stream_callback, session_id), None
             else:
-                return self._chat_nonstream(data)
-        except requests.exceptions.RequestException as e:
+                return self._chat_nonstream(data, session_id), None
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError: the server replied with something that is not JSON.
             logger.error(f"Error communicating with Ollama: {e}")
-            return f"Error communicating with Ollama: {e}"
+            return "", f"Error communicating with Ollama: {e}"
 
     def _chat_stream(
-        self, data: dict, stream_callback: Callable[[str], None]
+        self, data: dict, stream_callback: Callable[[str], None], session_id: int
     ) -> str:
         response_text = ""
-        response = requests.post(self.api_chat, json=data, stream=True)
-        response.raise_for_status()
+        response = self.session.post(self.api_chat, json=data, stream=True)
+        try:
+            response.raise_for_status()
 
-        for line in response.iter_lines():
-            if line:
-                chunk = json.loads(line)
-                if "content" in chunk.get("message", {}):
-                    text = chunk["message"]["content"]
+            # Split NDJSON by hand over large reads; iter_lines() buffers in
+            # much smaller pieces and costs noticeably more per token.
+            buf = b""
+            done = False
+            for chunk in response.iter_content(chunk_size=4096):
+                buf += chunk
+                while not done:
+                    nl = buf.find(b"\n")
+                    if nl == -1:
+                        break
+                    line, buf = buf[:nl], buf[nl + 1:]
+                    if not line:
+                        continue
+                    text, done = _extract_content(line)
+                    if text:
+                        response_text += text
+                        stream_callback(text)
+                if done:
+                    break
+            if not done and buf.strip():
+                text, _ = _extract_content(buf)
+                if text:
                     response_text += text
                     stream_callback(text)
-                if chunk.get("done", False):
-                    break
+        finally:
+            response.close()
 
-        self.conversation.append({"user": data["messages"][-1]["content"], "assistant": response_text})
+        self._record_turn(data["messages"][-1]["content"], response_text, session_id)
         return response_text
 
-    def _chat_nonstream(self, data: dict) -> str:
-        response = requests.post(self.api_chat, json=data)
+    def _chat_nonstream(self, data: dict, session_id: int) -> str:
+        response = self.session.post(self.api_chat, json=data)
         response.raise_for_status()
-        result = response.json()
-        content = result["message"]["content"]
-        self.conversation.append({"user": data["messages"][-1]["content"], "assistant": content})
+        content, _ = _extract_content(response.content)
+        self._record_turn(data["messages"][-1]["content"], content, session_id)
         return content
 
     def get_models(self) -> list[str]:
         """Get list of available models from Ollama."""
         try:
-            response = requests.get(self.api_models)
+            headers = {}
+            if self._models_etag and self._models_url == self.api_models:
+                headers["If-None-Match"] = self._models_etag
+            response = self.session.get(self.api_models, headers=headers, timeout=self.METADATA_TIMEOUT)
+            if response.status_code == 304:
+                self._set_connection_state(True)
+                return list(self._models_cache)
             response.raise_for_status()
-            result = response.json()
-            return [model["name"] for model in result.get("models", [])]
-        except requests.exceptions.RequestException as e:
+            result = jsonio.loads(response.content)
+            self._set_connection_state(True)
+            self._models_cache = [model["name"] for model in result.get("models", [])]
+            self._models_etag = response.headers.get("ETag")
+            self._models_url = self.api_models
+            return list(self._models_cache)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError: a 200 reply that is not JSON (wrong URL, proxy page).
             logger.error(f"Error getting models: {e}")
+            self._set_connection_state(False)
             return []
 
     def check_connection(self) -> bool:
-        """Check if Ollama server is available."""
+        """Check if Ollama server is available.
+
+        A result from any request in the last CONNECTION_TTL seconds is reused
+        instead of probing the server again.
+        """
+        state = self._conn_state
+        if (
+            state is not None
+            and state[1] == self.base_url
+            and time.monotonic() - state[0] < self.CONNECTION_TTL
+        ):
+            return state[2]
         try:
-            response = requests.get(f"{self.base_url}/api/version")
+            response = self.session.get(f"{self.base_url}/api/version", timeout=self.METADATA_TIMEOUT)
             response.raise_for_status()
+            self._set_connection_state(True)
             return True
         except requests.exceptions.RequestException:
+            self._set_connection_state(False)
             return False
 
-    def save_conversation(self, custom_name: Optional[str] = None) -> str:
-        """Save the current conversation to a JSON file."""
-        if not self.conversation:
-            return "No conversation to save"
+    def _set_connection_state(self, connected: bool) -> None:
+        self._conn_state = (time.monotonic(), self.base_url, connected)
 
-        import os
+    def save_conversation(self, custom_name: Optional[str] = None, directory: Optional[str] = None) -> str:
+        """Save the current conversation to a JSONL chat log.
 
-        if not os.path.exists(self.save_dir):
-            os.makedirs(self.save_dir)
+        The log goes in ``directory``, or ``save_dir`` if not given. Later
+        turns are appended to the same log as they complete.
+        """
+        if not self.assistants:
+            return "No conversation to save"
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename_base = custom_name or f"chat_{timestamp}"
+        filename, data = self._prepare_save(custom_name, directory)
+        self._write_save_files(filename, data)
+        return f"Conversation saved to {filename}"
+
+    def save_conversation_async(
+        self,
+        custom_name: Optional[str] = None,
+        on_done: Optional[Callable[[str], None]] = None,
+        directory: Optional[str] = None,
+    ) -> None:
+        """Snapshot the conversation now and write it to disk on a background thread.
+
+        ``on_done`` is called from the worker thread with a status message.
+        """
+        if not self.assistants:
+            if on_done:
+                on_done("No conversation to save")
+            return
+
+        filename, data = self._prepare_save(custom_name, directory)
+
+        def write() -> None:
+            try:
+                self._write_save_files(filename, data)
+                message = f"Conversation saved to {filename}"
+            except Exception as e:
+                logger.error(f"Error saving conversation: {e}")
+                message = f"Error saving conversation: {e}"
+            if on_done:
+                on_done(message)
+
+        threading.Thread(target=write, daemon=True).start()
+
+    def _prepare_save(self, custom_name: Optional[str], directory: Optional[str] = None) -> tuple[str, dict]:
+        # Read the assistant count first: a turn in progress appends its user
+        # message before the reply, so slicing both lists to it stays aligned.
+        turns = len(self.assistants)
+        now = datetime.now()
+        filename_base = custom_name or f"chat_{now.strftime('%Y%m%d_%H%M%S')}"
         self.chat_name = filename_base
 
-        filename = f"{self.save_dir}/{filename_base}.json"
+        filename = os.path.join(directory or self.save_dir, filename_base + CHAT_LOG_SUFFIX)
+        return filename, self._snapshot(filename_base, now, turns)
 
-        data = {
+    def _snapshot(self, chat_name: str, now: datetime, turns: int) -> dict:
+        return {
             "model": self.model,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "system_prompt": self.system_prompt,
-            "parameters": self.parameters,
-            "chat_name": filename_base,
-            "conversation": self.conversation,
+            "parameters": dict(self.parameters),
+            "chat_name": chat_name,
+            "turns": {"user": self.users[:turns], "assistant": self.assistants[:turns]},
         }
 
-        with open(filename, "w") as file:
-            json.dump(data, file, indent=2)
+    def export_conversation(self, filename: str) -> str:
+        """Write the conversation to a single pretty-printed JSON file.
 
-        text_filename = f"{self.save_dir}/{filename_base}.txt"
-        with open(text_filename, "w") as file:
-            file.write(f"Chat with Ollama ({self.model}) - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            if self.system_prompt:
-                file.write(f"System prompt: {self.system_prompt}\n\n")
-            for i, exchange in enumerate(self.conversation, 1):
-                file.write(f"[{i}] User: {exchange['user']}\n\n")
-                file.write(f"[{i}] Assistant: {exchange['assistant']}\n\n")
-                file.write("-" * 80 + "\n\n")
+        Saved chat logs stay compact; this is for sharing or reading by hand.
+        The exported file can be opened again with ``load_conversation``.
+        """
+        turns = len(self.assistants)
+        if not turns:
+            return "No conversation to export"
 
-        return f"Conversation saved to {filename}"
+        data = self._snapshot(self.chat_name or Path(filename).stem, datetime.now(), turns)
+        try:
+            with atomic_open(filename, "wb") as file:
+                file.write(jsonio.dumps(data, pretty=True))
+        except OSError as e:
+            logger.error(f"Error exporting conversation: {e}")
+            return f"Error exporting conversation: {e}"
+        return f"Conversation exported to {filename}"
+
+    def _write_save_files(self, filename: str, data: dict) -> None:
+        with self._save_lock:
+            if self.log_path == filename:
+                # The log already holds every finished turn; only record
+                # settings that changed since it was written.
+                meta = _log_metadata(data)
+                if meta != self._logged_meta:
+                    _append_log_lines(filename, [jsonio.dumps({"type": "session_metadata", **meta}) + b"\n"])
+                    self._logged_meta = meta
+                self._append_logged_turns_locked()
+                return
+
+        # First save, or Save As: write the full log and transcript once.
+        ts_hdr = datetime.fromisoformat(data["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+        header = f"Chat with Ollama ({data['model']}) - {ts_hdr}\n\n"
+        if data["system_prompt"]:
+            header += f"System prompt: {data['system_prompt']}\n\n"
+        body = _transcript_turns(data["turns"]["user"], data["turns"]["assistant"])
+
+        with self._save_lock:
+            directory = os.path.dirname(filename) or "."
+            if directory not in self._ensured_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._ensured_dirs.add(directory)
+
+            # Turns that finished after the snapshot was taken.
+            saved = len(data["turns"]["assistant"])
+            end = len(self.assistants)
+            users, assistants = self.users[saved:end], self.assistants[saved:end]
+
+            try:
+                with atomic_open(filename, "wb") as file:
+                    file.writelines(_encode_chat_log(data))
+                    file.writelines(_encode_turns(users, assistants))
+            except FileNotFoundError:
+                # The directory was removed since it was cached; recreate it next time.
+                self._ensured_dirs.discard(directory)
+                raise
+
+            text_filename = Path(filename).with_suffix(".txt")
+            with atomic_open(text_filename, "w", encoding="utf-8") as file:
+                file.write(header + body + _transcript_turns(users, assistants, saved + 1))
+
+            self.log_path = filename
+            self._logged_turns = end
+            self._logged_meta = _log_metadata(data)
 
     def load_conversation(self, filename: str) -> bool:
-        """Load a conversation from a JSON file."""
+        """Load a conversation from a JSONL chat log or a legacy JSON file."""
+        parsed = self.read_conversation(filename)
+        if parsed is None:
+            return False
+        self.apply_conversation(filename, *parsed)
+        return True
+
+    def read_conversation(self, filename: str) -> Optional[tuple[dict, bool]]:
+        """Read and parse a chat file without touching the current session.
+
+        Safe to call from a worker thread. Returns ``(data, is_log)`` with the
+        turns normalised to the ``{"user": [...], "assistant": [...]}`` layout,
+        or None if the file could not be read.
+        """
         try:
-            with open(filename, "r") as file:
-                data = json.load(file)
-
-            self.model = data.get("model", self.model)
-            self.system_prompt = data.get("system_prompt", "")
-            if "parameters" in data:
-                self.parameters.update(data["parameters"])
-            self.conversation = data.get("conversation", [])
-            self.chat_name = data.get("chat_name", filename.split("/")[-1].split(".")[0])
-            return True
+            with open(filename, "rb") as file:
+                data, is_log = _parse_chat_file(file.read())
+            if "turns" not in data:
+                conversation = data.pop("conversation", [])
+                data["turns"] = {
+                    "user": [exchange["user"] for exchange in conversation],
+                    "assistant": [exchange["assistant"] for exchange in conversation],
+                }
+            return data, is_log
         except Exception as e:
             logger.error(f"Error loading conversation: {e}")
-            return False
+            return None
+
+    def apply_conversation(self, filename: str, data: dict, is_log: bool) -> None:
+        """Replace the current session with data from ``read_conversation``."""
+        self.model = data.get("model", self.model)
+        self.system_prompt = data.get("system_prompt", "")
+        if "parameters" in data:
+            self.parameters.update(data["parameters"])
+        self.chat_name = data.get("chat_name", Path(filename).stem)
+        with self._save_lock:
+            self._session_id += 1
+            self.users = list(data["turns"]["user"])
+            self.assistants = list(data["turns"]["assistant"])
+            self.log_path = filename if is_log else None
+            self._logged_turns = len(self.assistants)
+            self._logged_meta = _log_metadata(data) if is_log else None
 
     def rename_chat_file(self, old_path: str, new_name: str) -> tuple[bool, str]:
         """Rename an existing chat file."""
-        import os
-
         try:
-            dir_path = os.path.dirname(old_path)
-            new_json_path = os.path.join(dir_path, f"{new_name}.json")
+            old_p = Path(old_path)
+            new_p = old_p.with_name(f"{new_name}{old_p.suffix}")
 
-            if os.path.exists(new_json_path):
+            if new_p.exists():
                 return False, "A file with this name already exists"
 
-            os.rename(old_path, new_json_path)
+            old_p.replace(new_p)
 
-            old_txt_path = old_path.replace(".json", ".txt")
-            if os.path.exists(old_txt_path):
-                new_txt_path = os.path.join(dir_path, f"{new_name}.txt")
-                os.rename(old_txt_path, new_txt_path)
+            old_txt = old_p.with_suffix(".txt")
+            if old_txt.exists():
+                old_txt.replace(new_p.with_suffix(".txt"))
 
-            with open(new_json_path, "r") as file:
-                data = json.load(file)
-            data["chat_name"] = new_name
-            with open(new_json_path, "w") as file:
-                json.dump(data, file, indent=2)
+            with self._save_lock:
+                data, is_log = _parse_chat_file(new_p.read_bytes())
+                data["chat_name"] = new_name
+                with atomic_open(new_p, "wb") as file:
+                    if is_log:
+                        file.writelines(_encode_chat_log(data))
+                    else:
+                        file.write(jsonio.dumps(data, pretty=True))
+                if self.log_path == old_path:
+                    self.log_path = str(new_p)
 
-            return True, new_json_path
+            return True, str(new_p)
         except Exception as e:
             logger.error(f"Error renaming chat file: {e}")
             return False, str(e)
@@ -212,15 +565,25 @@ class OllamaClient:
 
     def set_parameter(self, param: str, value: float) -> str:
         """Set a parameter value."""
-        if param in self.parameters:
+        if param not in self.parameters:
+            return f"Unknown parameter: {param}"
+        if type(value) is not float:
             try:
-                self.parameters[param] = float(value)
-                return f"Parameter {param} set to {value}"
-            except ValueError:
+                value = float(value)
+            except (TypeError, ValueError):
                 return f"Invalid value for {param}"
-        return f"Unknown parameter: {param}"
+        if self.parameters[param] == value:
+            return f"Parameter {param} unchanged"
+        self.parameters[param] = value
+        return f"Parameter {param} set to {value}"
 
     def clear_conversation(self) -> str:
         """Clear the current conversation."""
-        self.conversation = []
+        with self._save_lock:
+            self._session_id += 1
+            self.users = []
+            self.assistants = []
+            self.log_path = None
+            self._logged_turns = 0
+            self._logged_meta = None
         return "Conversation cleared"
\ No newline at end of file
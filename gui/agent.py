@@ -51,7 +51,7 @@ Use these tools to complete the task. Be precise and don't make unnecessary chan
         }
 
         try:
-            response = requests.post(self.ollama.api_chat, json=data, stream=True, timeout=120)
+            response = self.ollama.session.post(self.ollama.api_chat, json=data, stream=True, timeout=120)
             response.raise_for_status()
 
             full_response = ""
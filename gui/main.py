@@ -1,12 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, Menu, messagebox, filedialog
+from tkinter import font as tkFont
 import threading
+from collections import deque
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
-import sv_ttk
+try:
+    import sv_ttk
+except ImportError:
+    sv_ttk = None
 
-from core.ollama_client import OllamaClient
+from core.ollama_client import CHAT_LOG_SUFFIX, OllamaClient
 from utils.config import Config
 from gui.panels import FileBrowser, TerminalPanel
 from gui.agent import AgentPanel
@@ -34,6 +40,14 @@ class OllamaGUI:
         },
     }
 
+    TYPING_TEXT = "Thinking..."
+    # The display is only a view; the full history stays in the client.
+    MAX_DISPLAY_LINES = 2000
+    # Loaded chats render only their most recent exchanges; older ones are
+    # inserted in batches as the user scrolls towards the top.
+    LOAD_TAIL_TURNS = 50
+    HYDRATE_BATCH = 25
+
     def __init__(self, root: tk.Tk, mode: str = "chat"):
         self.root = root
         self.root.title("Simple Ollama GUI Client")
@@ -53,18 +67,32 @@ class OllamaGUI:
 
         self.theme = self.config.get_theme()
         self.current_file_path: Optional[str] = None
+        self._save_config_after_id: Optional[str] = None
+        self._param_after_id: dict[str, str] = {}
+        self._param_pending: dict[str, float] = {}
+        self._stream_buf: deque[str] = deque()
+        self._streaming = False
+        self._stream_pump_scheduled = False
+        self._typing_active = False
+        # True from sending a message until its reply has been rendered.
+        self._turn_active = False
+        self._rendered_offset = 0
+        self._hydrate_pending = False
+        self._about_window: Optional[tk.Toplevel] = None
 
         self._setup_menu()
         self._create_widgets()
         self._apply_theme()
         self._setup_context_menu()
-        self._check_connection()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.display_system_message("Welcome to Simple Ollama GUI Client!")
         self.display_system_message(f"Mode: {self.mode}")
         self.display_system_message(f"Current model: {self.client.model}")
 
-        threading.Thread(target=self._load_models, daemon=True).start()
+        # A successful /api/tags request also tells us the server is up, so
+        # startup skips the separate /api/version probe.
+        self._load_models()
 
     def _setup_menu(self) -> None:
         self.menubar = Menu(self.root)
@@ -74,8 +102,9 @@ class OllamaGUI:
         file_menu.add_command(label="Open Chat", command=self._load_chat)
         file_menu.add_command(label="Save Chat", command=self._save_chat)
         file_menu.add_command(label="Save Chat As...", command=lambda: self._save_chat(save_as=True))
+        file_menu.add_command(label="Export (pretty JSON)...", command=self._export_chat)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
         self.menubar.add_cascade(label="File", menu=file_menu)
 
         view_menu = Menu(self.menubar, tearoff=0)
@@ -104,6 +133,18 @@ class OllamaGUI:
 
         self.root.config(menu=self.menubar)
 
+    def _on_close(self) -> None:
+        # Flush debounced slider changes so the last adjustment is not lost.
+        for param, after_id in list(self._param_after_id.items()):
+            self.root.after_cancel(after_id)
+            self._commit_param(param)
+        if self._save_config_after_id is not None:
+            self.root.after_cancel(self._save_config_after_id)
+            self._save_config_after_id = None
+        self.config.save()
+        self.client.close()
+        self.root.destroy()
+
     def _create_widgets(self) -> None:
         padding = {"padx": 8, "pady": 8}
         small_padding = {"padx": 4, "pady": 4}
@@ -134,15 +175,27 @@ class OllamaGUI:
         self.conversation_frame = ttk.Frame(self.left_frame)
         self.conversation_frame.pack(fill=tk.BOTH, expand=True)
 
+        # Named fonts are resolved by Tk once and shared by every tag and
+        # widget that uses them.
+        self._font_body = tkFont.Font(family="Segoe UI", size=10)
+        self._font_timestamp = tkFont.Font(family="Segoe UI", size=8)
+        self._font_header = tkFont.Font(family="Segoe UI", size=10, weight="bold")
+        self._font_italic = tkFont.Font(family="Segoe UI", size=10, slant="italic")
+
         self.conversation_display = scrolledtext.ScrolledText(
             self.conversation_frame,
             wrap=tk.WORD,
-            font=("Segoe UI", 10),
+            font=self._font_body,
             selectbackground="#0078d7",
             selectforeground="white",
         )
         self.conversation_display.pack(fill=tk.BOTH, expand=True)
-        self.conversation_display.config(state=tk.DISABLED)
+        self.conversation_display.config(state=tk.DISABLED, yscrollcommand=self._on_display_scroll)
+        self.conversation_display.tag_config("timestamp", foreground="#6c757d", font=self._font_timestamp)
+        self.conversation_display.tag_config("user_header", foreground="#0366d6", font=self._font_header)
+        self.conversation_display.tag_config("assistant_header", foreground="#28a745", font=self._font_header)
+        self.conversation_display.tag_config("system_header", foreground="#5f4b8b", font=self._font_header)
+        self.conversation_display.tag_config("typing_indicator", foreground="#6c757d", font=self._font_italic)
 
         self.status_frame = ttk.Frame(self.left_frame)
         self.status_frame.pack(fill=tk.X, **small_padding)
@@ -163,7 +216,7 @@ class OllamaGUI:
         self.input_frame.pack(fill=tk.X, **padding)
 
         self.user_input = scrolledtext.ScrolledText(
-            self.input_frame, wrap=tk.WORD, height=4, font=("Segoe UI", 10)
+            self.input_frame, wrap=tk.WORD, height=4, font=self._font_body
         )
         self.user_input.pack(fill=tk.X, side=tk.LEFT, expand=True, padx=(0, 8))
         self.user_input.bind("<Return>", self._send_message)
@@ -211,9 +264,8 @@ class OllamaGUI:
             command=lambda v: self._update_parameter("temperature"),
         )
         self.temp_scale.pack(fill=tk.X, **small_padding)
-        self.temp_label = ttk.Label(
-            self.params_frame, text=f"{self.temp_var.get():.2f}", font=("Segoe UI", 9)
-        )
+        self.temp_display = tk.StringVar(value=f"{self.temp_var.get():.2f}")
+        self.temp_label = ttk.Label(self.params_frame, textvariable=self.temp_display, font=("Segoe UI", 9))
         self.temp_label.pack(anchor=tk.W, padx=8)
 
         ttk.Label(self.params_frame, text="Top-p:", font=("Segoe UI", 9)).pack(anchor=tk.W, padx=8, pady=(8, 0))
@@ -227,9 +279,8 @@ class OllamaGUI:
             command=lambda v: self._update_parameter("top_p"),
         )
         self.top_p_scale.pack(fill=tk.X, **small_padding)
-        self.top_p_label = ttk.Label(
-            self.params_frame, text=f"{self.top_p_var.get():.2f}", font=("Segoe UI", 9)
-        )
+        self.top_p_display = tk.StringVar(value=f"{self.top_p_var.get():.2f}")
+        self.top_p_label = ttk.Label(self.params_frame, textvariable=self.top_p_display, font=("Segoe UI", 9))
         self.top_p_label.pack(anchor=tk.W, padx=8)
 
         self.system_frame = ttk.LabelFrame(self.right_frame, text="System Prompt")
@@ -260,6 +311,9 @@ class OllamaGUI:
         """Run a shell command in a thread."""
         import subprocess
 
+        def emit(text: str) -> None:
+            self.root.after(0, output_callback, text)
+
         def run():
             try:
                 result = subprocess.run(
@@ -270,11 +324,11 @@ class OllamaGUI:
                     timeout=30,
                 )
                 output = result.stdout or result.stderr or "[No output]"
-                output_callback(output + "\n")
+                emit(output + "\n")
             except subprocess.TimeoutExpired:
-                output_callback("[Timeout - process took too long]\n")
+                emit("[Timeout - process took too long]\n")
             except Exception as e:
-                output_callback(f"[Error] {str(e)}\n")
+                emit(f"[Error] {str(e)}\n")
 
         threading.Thread(target=run, daemon=True).start()
 
@@ -289,7 +343,8 @@ class OllamaGUI:
         self.display_system_message(f"Switched to {mode} mode")
 
     def _apply_theme(self) -> None:
-        sv_ttk.set_theme(self.theme)
+        if sv_ttk is not None:
+            sv_ttk.set_theme(self.theme)
         colors = self.COLORS[self.theme]
 
         self.conversation_display.config(
@@ -345,12 +400,37 @@ class OllamaGUI:
     def _update_parameter(self, param: str) -> None:
         if param == "temperature":
             value = self.temp_var.get()
-            self.temp_label.config(text=f"{value:.2f}")
-            self.client.set_parameter(param, value)
+            self.temp_display.set(f"{value:.2f}")
         elif param == "top_p":
             value = self.top_p_var.get()
-            self.top_p_label.config(text=f"{value:.2f}")
-            self.client.set_parameter(param, value)
+            self.top_p_display.set(f"{value:.2f}")
+        else:
+            return
+        self._param_pending[param] = value
+        after_id = self._param_after_id.get(param)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+        self._param_after_id[param] = self.root.after(150, self._commit_param, param)
+
+    def _commit_param(self, param: str) -> None:
+        """Apply the last slider value once the drag has paused."""
+        self._param_after_id.pop(param, None)
+        value = self._param_pending.pop(param, None)
+        if value is None:
+            return
+        self.client.set_parameter(param, value)
+        self.config.set(param, self.client.parameters[param])
+        self._schedule_config_save()
+
+    def _schedule_config_save(self) -> None:
+        """Write the config file once the sliders have been idle for a moment."""
+        if self._save_config_after_id is not None:
+            self.root.after_cancel(self._save_config_after_id)
+        self._save_config_after_id = self.root.after(300, self._flush_save_config)
+
+    def _flush_save_config(self) -> None:
+        self._save_config_after_id = None
+        self.config.save()
 
     def _apply_system_prompt(self) -> None:
         prompt = self.system_prompt_entry.get("1.0", tk.END).strip()
@@ -360,20 +440,32 @@ class OllamaGUI:
         self.config.save()
 
     def _load_models(self) -> None:
-        models = self.client.get_models()
+        def do_load():
+            models = self.client.get_models()
+            connected = self.client.check_connection()
+            self.root.after(0, self._on_models_loaded, models, connected)
+
+        threading.Thread(target=do_load, daemon=True).start()
+
+    def _on_models_loaded(self, models: list[str], connected: bool) -> None:
+        self._set_connection_status(connected)
         if models:
-            self.model_dropdown["values"] = models
+            if tuple(models) != tuple(self.model_dropdown["values"]):
+                self.model_dropdown["values"] = models
             self.display_system_message(f"Loaded {len(models)} models")
 
     def _check_connection(self) -> None:
         def do_check():
             connected = self.client.check_connection()
-            self.status_var.set("Connected" if connected else "Disconnected")
-            fg = "green" if connected else "red"
-            self.status_indicator.config(foreground=fg)
+            self.root.after(0, self._set_connection_status, connected)
 
         threading.Thread(target=do_check, daemon=True).start()
 
+    def _set_connection_status(self, connected: bool) -> None:
+        self.status_var.set("Connected" if connected else "Disconnected")
+        fg = "green" if connected else "red"
+        self.status_indicator.config(foreground=fg)
+
     def _show_connection_settings(self) -> None:
         dialog = tk.Toplevel(self.root)
         dialog.title("Connection Settings")
@@ -430,10 +522,11 @@ class OllamaGUI:
                 for param, var in param_vars.items():
                     value = float(var.get())
                     self.client.set_parameter(param, value)
+                    self.config.set(param, value)
                 self.temp_var.set(self.client.parameters.get("temperature", 0.7))
                 self.top_p_var.set(self.client.parameters.get("top_p", 0.9))
-                self.temp_label.config(text=f"{self.temp_var.get():.2f}")
-                self.top_p_label.config(text=f"{self.top_p_var.get():.2f}")
+                self.temp_display.set(f"{self.temp_var.get():.2f}")
+                self.top_p_display.set(f"{self.top_p_var.get():.2f}")
                 self.display_system_message("Parameters updated")
                 self.config.save()
                 dialog.destroy()
@@ -449,116 +542,247 @@ class OllamaGUI:
         dialog.transient(self.root)
         dialog.grab_set()
 
-        prompt_text = scrolledtext.ScrolledText(dialog, wrap=tk.WORD, font=("Segoe UI", 10))
+        prompt_text = scrolledtext.ScrolledText(dialog, wrap=tk.WORD, font=self._font_body)
         prompt_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         prompt_text.insert("1.0", self.client.system_prompt)
 
         def save_prompt() -> None:
             prompt = prompt_text.get("1.0", tk.END).strip()
-            self.client.set_system_prompt(prompt)
-            self.system_prompt_entry.delete("1.0", tk.END)
-            self.system_prompt_entry.insert("1.0", prompt)
-            self.config.set_system_prompt(prompt)
-            self.config.save()
-            self.display_system_message("System prompt updated")
+            # Long prompts make the delete/insert round-trip noticeable, so
+            # leave the sidebar entry alone when it already holds this text.
+            if self.system_prompt_entry.get("1.0", tk.END).strip() != prompt:
+                self.system_prompt_entry.delete("1.0", tk.END)
+                self.system_prompt_entry.insert("1.0", prompt)
+            if prompt != self.client.system_prompt:
+                self.client.set_system_prompt(prompt)
+                self.config.set_system_prompt(prompt)
+                self.config.save()
+                self.display_system_message("System prompt updated")
             dialog.destroy()
 
         button_frame = ttk.Frame(dialog)
         button_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy()).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
         ttk.Button(button_frame, text="Save", command=save_prompt).pack(side=tk.RIGHT, padx=5)
 
     def display_system_message(self, message: str) -> None:
         self.display_message("System", message, "system_message")
 
-    def display_message(self, sender: str, message: str, tag: Optional[str] = None) -> None:
-        self.conversation_display.config(state=tk.NORMAL)
-
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
+    def _message_parts(
+        self, sender: str, message: str, tag: Optional[str] = None, timestamp: Optional[str] = None
+    ) -> tuple[str, ...]:
+        """Build the alternating text/tag arguments for one Text.insert call."""
+        timestamp = timestamp or datetime.now().strftime("%H:%M:%S")
+        tag = tag or ""
         if sender == "User":
-            self.conversation_display.insert(tk.END, f"\n[{timestamp}] ", "timestamp")
-            self.conversation_display.insert(tk.END, "You", "user_header")
-            self.conversation_display.insert(tk.END, "\n", "normal")
-            self.conversation_display.insert(tk.END, f"{message}\n", tag)
-        elif sender == "Assistant":
-            self.conversation_display.insert(tk.END, f"\n[{timestamp}] ", "timestamp")
-            self.conversation_display.insert(tk.END, "Assistant", "assistant_header")
-            self.conversation_display.insert(tk.END, "\n", "normal")
-            self.conversation_display.insert(tk.END, f"{message}\n", tag)
-        else:
-            self.conversation_display.insert(tk.END, f"\n[{timestamp}] ", "timestamp")
-            self.conversation_display.insert(tk.END, "System", "system_header")
-            self.conversation_display.insert(tk.END, f": {message}\n", tag)
+            return (f"\n[{timestamp}] ", "timestamp", "You", "user_header", "\n", "normal", f"{message}\n", tag)
+        if sender == "Assistant":
+            return (f"\n[{timestamp}] ", "timestamp", "Assistant", "assistant_header", "\n", "normal", f"{message}\n", tag)
+        return (f"\n[{timestamp}] ", "timestamp", "System", "system_header", f": {message}\n", tag)
+
+    def display_message(
+        self, sender: str, message: str, tag: Optional[str] = None, timestamp: Optional[str] = None
+    ) -> None:
+        self.conversation_display.config(state=tk.NORMAL)
 
-        self.conversation_display.tag_config("timestamp", foreground="#6c757d", font=("Segoe UI", 8))
-        self.conversation_display.tag_config("user_header", foreground="#0366d6", font=("Segoe UI", 10, "bold"))
-        self.conversation_display.tag_config("assistant_header", foreground="#28a745", font=("Segoe UI", 10, "bold"))
-        self.conversation_display.tag_config("system_header", foreground="#5f4b8b", font=("Segoe UI", 10, "bold"))
+        # One insert with alternating text/tag arguments instead of one Tcl
+        # call per fragment. Never read this widget with get("1.0", END) on a
+        # per-message or per-token path: it copies the whole buffer into
+        # Python. Use marks or a bounded index range instead.
+        self.conversation_display.insert(tk.END, *self._message_parts(sender, message, tag, timestamp))
+        self._trim_display()
 
         self.conversation_display.see(tk.END)
         self.conversation_display.config(state=tk.DISABLED)
 
     def _send_message(self, event=None) -> str:
+        # <Return> still fires while the Send button is disabled.
+        if self._turn_active:
+            return "break"
         user_message = self.user_input.get("1.0", tk.END).strip()
         if not user_message:
             return "break"
 
-        self.display_message("User", user_message, "user_message")
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.display_message("User", user_message, "user_message", timestamp)
         self.user_input.delete("1.0", tk.END)
 
         self.root.config(cursor="watch")
         self.send_button.config(state=tk.DISABLED)
-        self.root.update()
+        # Only redraw the cursor and button here. Avoid root.update() in UI
+        # code: it also dispatches pending user events re-entrantly; schedule
+        # work with after() instead.
+        self.root.update_idletasks()
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
         self.conversation_display.config(state=tk.NORMAL)
-        self.conversation_display.insert(tk.END, f"\n[{timestamp}] Assistant:\n", "assistant_header")
-        self.conversation_display.insert(tk.END, "Thinking...", "typing_indicator")
+        self.conversation_display.insert(
+            tk.END, f"\n[{timestamp}] Assistant:\n", "assistant_header", self.TYPING_TEXT, "typing_indicator"
+        )
+        # Remember where the placeholder starts so it can be removed without
+        # searching the whole buffer ("end" sits after Tk's trailing newline).
+        self.conversation_display.mark_set("typing_start", f"end-{len(self.TYPING_TEXT) + 1}c")
+        self.conversation_display.mark_gravity("typing_start", tk.LEFT)
+        self._typing_active = True
         self.conversation_display.see(tk.END)
         self.conversation_display.config(state=tk.DISABLED)
+        self._turn_active = True
 
-        def stream_handler(text_chunk: str) -> None:
-            self.conversation_display.config(state=tk.NORMAL)
-            if "Thinking..." in self.conversation_display.get("1.0", tk.END):
-                typing_pos = self.conversation_display.search("Thinking...", "1.0", tk.END)
-                if typing_pos:
-                    self.conversation_display.delete(typing_pos, f"{typing_pos}+10c")
-            self.conversation_display.insert(tk.END, text_chunk, "assistant_message")
-            self.conversation_display.see(tk.END)
-            self.conversation_display.config(state=tk.DISABLED)
-            self.root.update()
+        self._streaming = True
+        if not self._stream_pump_scheduled:
+            self._stream_pump_scheduled = True
+            self.root.after(30, self._pump_stream)
 
+        # Tkinter is not thread-safe: the worker only enqueues chunks and
+        # hands the outcome back; every widget call happens on the Tk thread.
         def process_message() -> None:
             try:
-                self.client.chat(user_message, stream_handler)
-                self.model_status.config(text=f"Model: {self.client.model}")
+                _, error = self.client.chat_result(user_message, self._enqueue_token)
             except Exception as e:
-                self.conversation_display.config(state=tk.NORMAL)
-                typing_pos = self.conversation_display.search("Thinking...", "1.0", tk.END)
-                if typing_pos:
-                    self.conversation_display.delete(typing_pos, f"{typing_pos}+10c")
-                self.conversation_display.config(state=tk.DISABLED)
-                self.display_system_message(f"Error: {str(e)}")
+                error = f"Error: {str(e)}"
             finally:
-                self.root.config(cursor="")
-                self.send_button.config(state=tk.NORMAL)
+                self._streaming = False
+            self.root.after(0, self._finish_turn, error)
 
         threading.Thread(target=process_message, daemon=True).start()
         return "break"
 
+    def _enqueue_token(self, text_chunk: str) -> None:
+        """Buffer a streamed chunk from the worker thread; _pump_stream renders it."""
+        if not text_chunk:
+            return
+        self._stream_buf.append(text_chunk)
+
+    def _pump_stream(self) -> None:
+        """Drain buffered chunks into the display about 30 times a second while streaming."""
+        # Read the flag before draining so chunks queued just before the
+        # stream finished are still rendered by this final pass.
+        active = self._streaming
+        if active:
+            self.root.after(30, self._pump_stream)
+        else:
+            self._stream_pump_scheduled = False
+        self._flush_stream()
+
+    def _flush_stream(self) -> None:
+        chunks = []
+        while self._stream_buf:
+            chunks.append(self._stream_buf.popleft())
+        if not chunks:
+            return
+
+        # One state toggle per batch, not per chunk; keeping the widget
+        # NORMAL for the whole reply would let the user type into it.
+        self.conversation_display.config(state=tk.NORMAL)
+        self._clear_typing_indicator()
+        self.conversation_display.insert(tk.END, "".join(chunks), "assistant_message")
+        self._trim_display()
+        self.conversation_display.see(tk.END)
+        self.conversation_display.config(state=tk.DISABLED)
+
+    def _finish_turn(self, error: Optional[str]) -> None:
+        """Render whatever is still buffered, then end the turn on the Tk thread."""
+        self._flush_stream()
+        if self._typing_active:
+            # Nothing was streamed, e.g. an empty reply or a failed request.
+            self.conversation_display.config(state=tk.NORMAL)
+            self._clear_typing_indicator()
+            self.conversation_display.config(state=tk.DISABLED)
+        if error:
+            # Also shown after a partial reply when the stream broke off.
+            self.display_system_message(error)
+        self._turn_active = False
+        self._set_model_status(self.client.model)
+        self.root.config(cursor="")
+        self.send_button.config(state=tk.NORMAL)
+
+    def _trim_display(self) -> None:
+        """Drop the oldest lines once the display exceeds MAX_DISPLAY_LINES."""
+        end_line = int(self.conversation_display.index("end-1c").split(".")[0])
+        if end_line > self.MAX_DISPLAY_LINES:
+            self.conversation_display.delete("1.0", f"{end_line - self.MAX_DISPLAY_LINES}.0")
+            # Rendered turns were cut from the top, so hydrating older ones
+            # above them would leave a gap.
+            self._rendered_offset = 0
+
+    def _on_display_scroll(self, first: str, last: str) -> None:
+        self.conversation_display.vbar.set(first, last)
+        if float(first) < 0.05 and self._rendered_offset > 0 and not self._hydrate_pending:
+            self._hydrate_pending = True
+            self.root.after_idle(self._hydrate_older)
+
+    def _hydrate_older(self) -> None:
+        """Insert the next batch of older loaded exchanges above the visible ones."""
+        self._hydrate_pending = False
+        end = self._rendered_offset
+        if end <= 0:
+            return
+        display = self.conversation_display
+
+        # Fill only the room left under MAX_DISPLAY_LINES; otherwise the next
+        # trim would cut away the very turns the user scrolled up to read.
+        # Each exchange renders as six lines plus its messages' own newlines.
+        budget = self.MAX_DISPLAY_LINES - int(display.index("end-1c").split(".")[0])
+        start = end
+        while start > max(0, end - self.HYDRATE_BATCH):
+            user, assistant = self.client.users[start - 1], self.client.assistants[start - 1]
+            lines = 6 + user.count("\n") + assistant.count("\n")
+            if lines > budget:
+                break
+            budget -= lines
+            start -= 1
+        if start == end:
+            # The display is full; older turns stay in the client only.
+            self._rendered_offset = 0
+            return
+
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        parts: list[str] = []
+        for user, assistant in zip(self.client.users[start:end], self.client.assistants[start:end]):
+            parts.extend(self._message_parts("User", user, "user_message", timestamp))
+            parts.extend(self._message_parts("Assistant", assistant, "assistant_message", timestamp))
+        self._rendered_offset = start
+
+        # Keep the currently visible text in place while content grows above it.
+        display.mark_set("hydrate_anchor", "@0,0")
+        display.mark_gravity("hydrate_anchor", tk.RIGHT)
+        display.config(state=tk.NORMAL)
+        display.insert("1.0", *parts)
+        display.config(state=tk.DISABLED)
+        display.yview("hydrate_anchor")
+
+    def _reset_display(self) -> None:
+        """Remove everything from the chat display, including a pending placeholder."""
+        # The wipe collapses the typing_start mark onto 1.0; forget the
+        # placeholder so a later clear cannot delete unrelated text there.
+        self._typing_active = False
+        self.conversation_display.config(state=tk.NORMAL)
+        self.conversation_display.delete("1.0", tk.END)
+        self.conversation_display.config(state=tk.DISABLED)
+
+    def _clear_typing_indicator(self) -> None:
+        """Delete the "Thinking..." placeholder; the widget must be in NORMAL state."""
+        if self._typing_active:
+            self.conversation_display.delete("typing_start", f"typing_start+{len(self.TYPING_TEXT)}c")
+            self._typing_active = False
+
+    def _set_model_status(self, model: str) -> None:
+        text = f"Model: {model}"
+        if self.model_status.cget("text") != text:
+            self.model_status.config(text=text)
+
     def _change_model(self, event=None) -> None:
         new_model = self.model_var.get().strip()
-        if new_model:
-            self.client.set_model(new_model)
-            self.model_status.config(text=f"Model: {new_model}")
-            self.config.set_model(new_model)
-            self.config.save()
-            self.display_system_message(f"Model changed to {new_model}")
+        if not new_model or new_model == self.client.model:
+            return
+        self.client.set_model(new_model)
+        self._set_model_status(new_model)
+        self.config.set_model(new_model)
+        self.config.save()
+        self.display_system_message(f"Model changed to {new_model}")
 
     def _save_chat(self, save_as: bool = False) -> None:
-        if not self.client.conversation:
+        if not self.client.assistants:
             messagebox.showinfo("Save Chat", "No conversation to save")
             return
 
@@ -566,82 +790,117 @@ class OllamaGUI:
             default_name = self.client.chat_name or f"chat_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             filename = filedialog.asksaveasfilename(
                 initialdir=self.client.save_dir,
-                initialfile=f"{default_name}.json",
+                initialfile=f"{default_name}{CHAT_LOG_SUFFIX}",
                 title="Save Chat As",
-                filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")],
+                filetypes=[("Chat Logs", f"*{CHAT_LOG_SUFFIX}"), ("All Files", "*.*")],
             )
             if not filename:
                 return
 
-            import os
+            path = Path(filename)
+            base_name = path.stem if path.suffix.lower() in (".json", CHAT_LOG_SUFFIX) else path.name
+            directory = str(path.parent)
+        else:
+            base_name = self.client.chat_name
+            directory = str(Path(self.current_file_path).parent) if self.current_file_path else None
 
-            dir_path = os.path.dirname(filename)
-            base_name = os.path.basename(filename)
-            if base_name.lower().endswith(".json"):
-                base_name = os.path.splitext(base_name)[0]
+        # Creating the directory and writing the files both happen on the
+        # client's save thread.
+        self.client.save_conversation_async(base_name, self._on_chat_saved, directory)
+        self.current_file_path = str(Path(directory or self.client.save_dir, base_name + CHAT_LOG_SUFFIX))
 
-            if dir_path != self.client.save_dir and dir_path:
-                if not os.path.exists(dir_path):
-                    os.makedirs(dir_path)
+    def _on_chat_saved(self, message: str) -> None:
+        """Called from the save worker thread; hand the result back to Tk."""
+        self.root.after(0, self.display_system_message, message)
 
-            self.client.save_conversation(base_name)
-            self.current_file_path = filename
-            self.client.chat_name = base_name
-            self.display_system_message(f"Conversation saved to {filename}")
-        else:
-            filename = f"{self.client.save_dir}/{self.client.chat_name}.json"
-            self.client.save_conversation(self.client.chat_name)
-            self.current_file_path = filename
-            self.display_system_message(f"Conversation saved to {filename}")
+    def _export_chat(self) -> None:
+        if not self.client.assistants:
+            messagebox.showinfo("Export Chat", "No conversation to export")
+            return
+
+        default_name = self.client.chat_name or f"chat_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        filename = filedialog.asksaveasfilename(
+            initialdir=self.client.save_dir,
+            initialfile=f"{default_name}.json",
+            defaultextension=".json",
+            title="Export Chat",
+            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")],
+        )
+        if not filename:
+            return
+
+        def export() -> None:
+            message = self.client.export_conversation(filename)
+            self.root.after(0, self.display_system_message, message)
+
+        threading.Thread(target=export, daemon=True).start()
 
     def _load_chat(self) -> None:
         filename = filedialog.askopenfilename(
             initialdir=self.client.save_dir,
             title="Load Chat",
-            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")],
+            filetypes=[("Chat Files", f"*{CHAT_LOG_SUFFIX} *.json"), ("All Files", "*.*")],
         )
         if not filename:
             return
 
-        if self.client.load_conversation(filename):
+        threading.Thread(target=self._do_load, args=(filename,), daemon=True).start()
+
+    def _do_load(self, filename: str) -> None:
+        # Only the read and parse run here; the session is swapped on the Tk
+        # thread so a reply or save in flight never sees a half-loaded chat.
+        parsed = self.client.read_conversation(filename)
+        self.root.after(0, self._apply_loaded_state, filename, parsed)
+
+    def _apply_loaded_state(self, filename: str, parsed: Optional[tuple[dict, bool]]) -> None:
+        if parsed is not None:
+            self.client.apply_conversation(filename, *parsed)
             self.current_file_path = filename
 
-            self.conversation_display.config(state=tk.NORMAL)
-            self.conversation_display.delete("1.0", tk.END)
-            self.conversation_display.config(state=tk.DISABLED)
+            self._reset_display()
 
             self.model_var.set(self.client.model)
-            self.model_status.config(text=f"Model: {self.client.model}")
+            self._set_model_status(self.client.model)
 
             self.system_prompt_entry.delete("1.0", tk.END)
             self.system_prompt_entry.insert("1.0", self.client.system_prompt)
 
             self.temp_var.set(self.client.parameters.get("temperature", 0.7))
             self.top_p_var.set(self.client.parameters.get("top_p", 0.9))
-            self.temp_label.config(text=f"{self.temp_var.get():.2f}")
-            self.top_p_label.config(text=f"{self.top_p_var.get():.2f}")
+            self.temp_display.set(f"{self.temp_var.get():.2f}")
+            self.top_p_display.set(f"{self.top_p_var.get():.2f}")
 
-            chat_name = self.client.chat_name or filename.split("/")[-1]
-            self.display_system_message(f"Loaded conversation: {chat_name}")
+            tail_start = max(0, len(self.client.assistants) - self.LOAD_TAIL_TURNS)
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            self._rendered_offset = tail_start
+            for user, assistant in zip(self.client.users[tail_start:], self.client.assistants[tail_start:]):
+                self.display_message("User", user, "user_message", timestamp)
+                self.display_message("Assistant", assistant, "assistant_message", timestamp)
 
-            for exchange in self.client.conversation:
-                self.display_message("User", exchange["user"], "user_message")
-                self.display_message("Assistant", exchange["assistant"], "assistant_message")
+            chat_name = self.client.chat_name or Path(filename).name
+            self.display_system_message(f"Loaded conversation: {chat_name}")
         else:
             messagebox.showerror("Error", f"Failed to load conversation from {filename}")
 
     def _clear_chat(self) -> None:
         if messagebox.askyesno("Clear Chat", "Are you sure you want to clear the current conversation?"):
             self.client.clear_conversation()
-            self.conversation_display.config(state=tk.NORMAL)
-            self.conversation_display.delete("1.0", tk.END)
-            self.conversation_display.config(state=tk.DISABLED)
+            self._reset_display()
+            self._rendered_offset = 0
             self.current_file_path = None
             self.client.chat_name = ""
             self.display_system_message("Conversation cleared")
 
     def _show_about(self) -> None:
+        about_window = self._about_window
+        if about_window is not None and about_window.winfo_exists():
+            about_window.deiconify()
+            about_window.lift()
+            about_window.grab_set()
+            return
+
         about_window = tk.Toplevel(self.root)
+        self._about_window = about_window
         about_window.title("About Simple Ollama GUI Client")
         about_window.geometry("500x400")
         about_window.resizable(True, True)
@@ -668,7 +927,13 @@ class OllamaGUI:
         )
         ttk.Label(main_frame, text=desc, justify=tk.CENTER).pack(pady=(0, 15))
 
-        ttk.Button(about_window, text="Close", command=about_window.destroy).pack(pady=10)
+        # Hide rather than destroy so reopening doesn't rebuild the widgets.
+        def hide() -> None:
+            about_window.grab_release()
+            about_window.withdraw()
+
+        about_window.protocol("WM_DELETE_WINDOW", hide)
+        ttk.Button(about_window, text="Close", command=hide).pack(pady=10)
 
     def _setup_context_menu(self) -> None:
         self.context_menu = Menu(self.root, tearoff=0)
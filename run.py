@@ -11,10 +11,14 @@ logging.basicConfig(
 logger = logging.getLogger("OllamaChat")
 
 
-def install_dependencies():
+def install_dependencies(auto_install: bool = False):
     try:
         import sv_ttk
     except ImportError:
+        if not auto_install:
+            print("sv_ttk not found, continuing with default theme...")
+            print("Run with --install-deps or 'python setup.py' to install it.")
+            return
         print("Installing sv_ttk for modern theme...")
         try:
             import subprocess
@@ -27,7 +31,7 @@ def install_dependencies():
 
 
 def main():
-    install_dependencies()
+    install_dependencies(auto_install="--install-deps" in sys.argv[1:])
 
     import tkinter as tk
     from gui.main import OllamaGUI
@@ -1,17 +1,35 @@
 #!/usr/bin/env python
+import importlib
+import importlib.util
 import subprocess
 import sys
+from importlib import metadata
+
+# Oldest pip we are happy to run as-is; anything older gets upgraded first.
+MIN_PIP = (23, 0)
+
+
+def _pip_version():
+    try:
+        return tuple(int(part) for part in metadata.version("pip").split(".")[:2])
+    except (metadata.PackageNotFoundError, ValueError):
+        return (0,)
+
 
 def setup():
     """Set up the Ollama GUI Client environment"""
-    # Upgrade pip first
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
+    # Upgrade pip first, but only if it is out of date - a no-op upgrade
+    # still costs a full pip run.
+    if _pip_version() < MIN_PIP:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
     
     # Install core requirements
     subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
     
-    # Ensure sv-ttk is properly installed
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "sv-ttk"])
+    # Ensure sv-ttk is properly installed (requirements.txt normally covers it)
+    importlib.invalidate_caches()
+    if importlib.util.find_spec("sv_ttk") is None:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "sv-ttk"])
     
     print("Setup complete! You can now run the application with 'python run.py'")
 
@@ -1,9 +1,11 @@
-import configparser
 import os
 from typing import Any
 
 import logging
 
+from utils import jsonio
+from utils.fileio import atomic_open
+
 logger = logging.getLogger("OllamaChat")
 
 
@@ -22,57 +24,79 @@ class Config:
         "max_tokens": 2000,
     }
 
-    def __init__(self, config_file: str = "config.ini"):
+    PARAM_KEYS = frozenset(("temperature", "top_p", "top_k", "num_ctx", "max_tokens"))
+
+    def __init__(self, config_file: str = "config.json"):
         self.config_file = config_file
-        self.config = configparser.ConfigParser()
+        self.values: dict[str, Any] = {
+            key: float(value) if key in self.PARAM_KEYS else str(value)
+            for key, value in self.DEFAULT_CONFIG.items()
+        }
+        self._dirty = False
         self._load()
 
     def _load(self) -> None:
-        """Load configuration from file."""
+        """Load configuration from file, migrating an old config.ini if present."""
+        legacy_file = os.path.splitext(self.config_file)[0] + ".ini"
         if os.path.exists(self.config_file):
-            self.config.read(self.config_file)
-
-        if "Ollama" not in self.config:
-            self.config["Ollama"] = {}
-        if "Parameters" not in self.config:
-            self.config["Parameters"] = {}
-        if "UI" not in self.config:
-            self.config["UI"] = {}
-
-        for key, value in self.DEFAULT_CONFIG.items():
-            section = "Parameters" if key in ("temperature", "top_p", "top_k", "num_ctx", "max_tokens") else "Ollama"
-            if key not in self.config[section]:
-                self.config[section][key] = str(value)
+            try:
+                with open(self.config_file, "rb") as f:
+                    data = jsonio.loads(f.read())
+            except ValueError as e:
+                logger.error(f"Error reading {self.config_file}, using defaults: {e}")
+                return
+        elif os.path.exists(legacy_file):
+            data = self._read_legacy_ini(legacy_file)
+            self._dirty = True
+        else:
+            return
+
+        params = data.pop("parameters", {})
+        for key, value in data.items():
+            if key in self.DEFAULT_CONFIG and key not in self.PARAM_KEYS:
+                self.values[key] = str(value)
+        for key, value in params.items():
+            if key in self.PARAM_KEYS:
+                self.values[key] = float(value)
+
+    @staticmethod
+    def _read_legacy_ini(path: str) -> dict[str, Any]:
+        import configparser
+
+        parser = configparser.ConfigParser()
+        parser.read(path)
+        data: dict[str, Any] = dict(parser["Ollama"]) if "Ollama" in parser else {}
+        if "Parameters" in parser:
+            data["parameters"] = dict(parser["Parameters"])
+        return data
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
-        section = "Parameters" if key in ("temperature", "top_p", "top_k", "num_ctx", "max_tokens") else "Ollama"
-        if key in self.config[section]:
-            value = self.config[section][key]
-            if key in ("temperature", "top_p", "top_k", "num_ctx", "max_tokens"):
-                return float(value)
+        value = self.values.get(key)
+        if value is not None:
             return value
         return default or self.DEFAULT_CONFIG.get(key)
 
     def set(self, key: str, value: Any) -> None:
-        """Set a configuration value."""
-        section = "Parameters" if key in ("temperature", "top_p", "top_k", "num_ctx", "max_tokens") else "Ollama"
-        self.config[section][key] = str(value)
+        """Set a configuration value, marking the config dirty only if it changed."""
+        value = float(value) if key in self.PARAM_KEYS else str(value)
+        if self.values.get(key) != value:
+            self.values[key] = value
+            self._dirty = True
 
     def get_params(self) -> dict[str, float]:
         """Get all parameters as a dictionary."""
-        return {
-            "temperature": self.get("temperature", 0.7),
-            "top_p": self.get("top_p", 0.9),
-            "top_k": self.get("top_k", 40),
-            "num_ctx": self.get("num_ctx", 2048),
-            "max_tokens": self.get("max_tokens", 2000),
-        }
+        return {key: self.values[key] for key in ("temperature", "top_p", "top_k", "num_ctx", "max_tokens")}
 
     def save(self) -> None:
-        """Save configuration to file."""
-        with open(self.config_file, "w") as f:
-            self.config.write(f)
+        """Save configuration to file if anything changed since the last save."""
+        if not self._dirty:
+            return
+        data = {key: value for key, value in self.values.items() if key not in self.PARAM_KEYS}
+        data["parameters"] = self.get_params()
+        with atomic_open(self.config_file, "wb") as f:
+            f.write(jsonio.dumps(data, pretty=True))
+        self._dirty = False
         logger.info("Configuration saved")
 
     def get_base_url(self) -> str:
@@ -97,4 +121,4 @@ class Config:
         return self.get("theme", "dark")
 
     def set_theme(self, theme: str) -> None:
-        self.set("theme", theme)
\ No newline at end of file
+        self.set("theme", theme)
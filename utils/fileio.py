@@ -0,0 +1,32 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Iterator, Union
+
+# mkstemp creates files as 0600; read the umask once so replaced files keep
+# the permissions a plain open() would have given them.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def atomic_open(path: Union[str, os.PathLike], mode: str = "wb", **kwargs) -> Iterator[IO]:
+    """Open a temporary file next to ``path`` and move it into place on success.
+
+    Readers see either the old file or the complete new one, never a partial
+    write. If the block raises, the temporary file is removed and ``path`` is
+    left untouched.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        with os.fdopen(fd, mode, **kwargs) as file:
+            yield file
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise